@@ -3,20 +3,34 @@ API endpoints for document redaction functionality.
 """
 
 from fastapi import APIRouter, HTTPException, UploadFile, File, Form
-from fastapi.responses import JSONResponse
-from typing import List, Optional
+from fastapi.responses import JSONResponse, ORJSONResponse, StreamingResponse
+from typing import Dict, Iterator, List, Optional
+import asyncio
 import tempfile
 import os
+import hashlib
 from pathlib import Path
 
+import aiofiles
+import orjson
+
+from app.core.config import settings
 from app.services.redaction_service import OpenSourceRedactionService, EntityType
 from app.services.document_processor import DocumentProcessor
+from app.services.cache_service import ResultCache
 
 router = APIRouter()
 
+# Uploads are copied to disk in chunks of this size
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1MB
+
+# Matches per line of a streamed (NDJSON) redaction result
+STREAM_MATCHES_PER_LINE = 1000
+
 # Initialize services
 redaction_service = OpenSourceRedactionService()
 document_processor = DocumentProcessor()
+result_cache = ResultCache()
 
 
 @router.post("/analyze-text")
@@ -31,36 +45,23 @@ async def analyze_text(text: str = Form(...)):
         Analysis results with found entities
     """
     try:
-        # Find all entities
-        spacy_matches = redaction_service.find_entities_with_spacy(text)
-        transformer_matches = redaction_service.find_entities_with_transformers(text)
-        regex_matches = redaction_service.find_entities_with_regex(text)
-
-        # Combine and merge matches
-        all_matches = spacy_matches + transformer_matches + regex_matches
-        final_matches = redaction_service.merge_overlapping_matches(all_matches)
+        # Find all entities and merge overlapping matches
+        if len(text) > settings.PARALLEL_ANALYSIS_MIN_CHARS:
+            pages = redaction_service.split_pages(text, settings.PARALLEL_ANALYSIS_MIN_CHARS)
+            final_matches = await redaction_service.analyze_pages(pages)
+        else:
+            final_matches = await asyncio.to_thread(redaction_service.find_all_entities, text)
 
         # Generate summary
         summary = redaction_service.get_redaction_summary(final_matches)
 
-        # Convert matches to serializable format
-        matches_data = []
-        for match in final_matches:
-            matches_data.append({
-                "text": match.text,
-                "start": match.start,
-                "end": match.end,
-                "entity_type": match.entity_type.value,
-                "confidence": match.confidence,
-                "method": match.method
-            })
-
-        return {
+        # orjson serializes RedactionMatch dataclasses and enums natively
+        return ORJSONResponse({
             "success": True,
-            "matches": matches_data,
+            "matches": final_matches,
             "summary": summary,
             "original_text_length": len(text)
-        }
+        })
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
@@ -82,28 +83,23 @@ async def redact_text(
         Redacted text and analysis results
     """
     try:
-        redacted_text, matches = redaction_service.redact_text(text, redaction_char)
-        summary = redaction_service.get_redaction_summary(matches)
-
-        # Convert matches to serializable format
-        matches_data = []
-        for match in matches:
-            matches_data.append({
-                "text": match.text,
-                "start": match.start,
-                "end": match.end,
-                "entity_type": match.entity_type.value,
-                "confidence": match.confidence,
-                "method": match.method
-            })
-
-        return {
+        cache_key = result_cache.redaction_key(text, redaction_char, redaction_service.config_fingerprint)
+        result = await result_cache.get(cache_key)
+
+        if result is None:
+            redacted_text, matches = await asyncio.to_thread(redaction_service.redact_text, text, redaction_char)
+            summary = redaction_service.get_redaction_summary(matches)
+
+            result = {"redacted_text": redacted_text, "matches": matches, "summary": summary}
+            await result_cache.set(cache_key, result)
+
+        return ORJSONResponse({
             "success": True,
             "original_text": text,
-            "redacted_text": redacted_text,
-            "matches": matches_data,
-            "summary": summary
-        }
+            "redacted_text": result["redacted_text"],
+            "matches": result["matches"],
+            "summary": result["summary"]
+        })
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Redaction failed: {str(e)}")
@@ -131,25 +127,45 @@ async def process_document(file: UploadFile = File(...)):
                 detail=f"Unsupported file type: {file_extension}"
             )
 
-        # Save uploaded file temporarily
-        with tempfile.NamedTemporaryFile(delete=False, suffix=file_extension) as temp_file:
-            content = await file.read()
-            temp_file.write(content)
-            temp_file_path = temp_file.name
+        # Save uploaded file temporarily, streaming it in chunks
+        fd, temp_file_path = tempfile.mkstemp(suffix=file_extension)
+        os.close(fd)
 
         try:
-            # Process the document
-            document_content = document_processor.process_document(temp_file_path)
+            content_hash = hashlib.sha256()
+            async with aiofiles.open(temp_file_path, "wb") as temp_file:
+                while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                    content_hash.update(chunk)
+                    await temp_file.write(chunk)
+
+            # Reuse the extraction of an identical earlier upload
+            cache_key = result_cache.document_key(content_hash.hexdigest())
+            document_data = await result_cache.get(cache_key)
+
+            if document_data is None:
+                # Process the document off the event loop
+                loop = asyncio.get_running_loop()
+                document_content = await loop.run_in_executor(
+                    None, document_processor.process_document, temp_file_path
+                )
+                document_data = {
+                    "file_type": document_content.file_type,
+                    "text": document_content.text,
+                    "pages": document_content.pages,
+                    "metadata": document_content.metadata,
+                    "has_images": document_content.has_images
+                }
+                await result_cache.set(cache_key, document_data)
 
             return {
                 "success": True,
                 "filename": file.filename,
-                "file_type": document_content.file_type,
-                "text": document_content.text,
-                "pages": document_content.pages,
-                "metadata": document_content.metadata,
-                "has_images": document_content.has_images,
-                "text_length": len(document_content.text)
+                "file_type": document_data["file_type"],
+                "text": document_data["text"],
+                "pages": document_data["pages"],
+                "metadata": document_data["metadata"],
+                "has_images": document_data["has_images"],
+                "text_length": len(document_data["text"])
             }
 
         finally:
@@ -162,10 +178,26 @@ async def process_document(file: UploadFile = File(...)):
         raise HTTPException(status_code=500, detail=f"Document processing failed: {str(e)}")
 
 
+def _stream_redaction_result(header: Dict, matches: List, summary: Dict) -> Iterator[bytes]:
+    """
+    Yield a redaction result as NDJSON.
+
+    The first line holds the document fields and texts, followed by lines of up to
+    STREAM_MATCHES_PER_LINE matches, and a final line with the summary.
+    """
+    yield orjson.dumps(header) + b"\n"
+
+    for index in range(0, len(matches), STREAM_MATCHES_PER_LINE):
+        yield orjson.dumps({"matches": matches[index:index + STREAM_MATCHES_PER_LINE]}) + b"\n"
+
+    yield orjson.dumps({"summary": summary}) + b"\n"
+
+
 @router.post("/redact-document")
 async def redact_document(
     file: UploadFile = File(...),
-    redaction_char: str = Form("█")
+    redaction_char: str = Form("█"),
+    stream: bool = Form(False)
 ):
     """
     Process and redact an uploaded document.
@@ -173,6 +205,7 @@ async def redact_document(
     Args:
         file: Uploaded document file
         redaction_char: Character to use for redaction
+        stream: Return the result as streamed NDJSON lines (for large documents)
 
     Returns:
         Redacted text and analysis results
@@ -184,33 +217,46 @@ async def redact_document(
         if not document_response["success"]:
             return document_response
 
-        # Then redact the extracted text
+        # Then redact the extracted text, analyzing pages concurrently
         text = document_response["text"]
-        redacted_text, matches = redaction_service.redact_text(text, redaction_char)
-        summary = redaction_service.get_redaction_summary(matches)
-
-        # Convert matches to serializable format
-        matches_data = []
-        for match in matches:
-            matches_data.append({
-                "text": match.text,
-                "start": match.start,
-                "end": match.end,
-                "entity_type": match.entity_type.value,
-                "confidence": match.confidence,
-                "method": match.method
-            })
-
-        return {
+        cache_key = result_cache.redaction_key(text, redaction_char, redaction_service.config_fingerprint)
+        result = await result_cache.get(cache_key)
+
+        if result is None:
+            pages = document_response["pages"]
+            if pages and "\n\n".join(pages) == text:
+                redacted_text, matches = await redaction_service.redact_pages(pages, redaction_char)
+            else:
+                redacted_text, matches = await asyncio.to_thread(redaction_service.redact_text, text, redaction_char)
+            summary = redaction_service.get_redaction_summary(matches)
+
+            result = {"redacted_text": redacted_text, "matches": matches, "summary": summary}
+            await result_cache.set(cache_key, result)
+
+        if stream:
+            header = {
+                "success": True,
+                "filename": document_response["filename"],
+                "file_type": document_response["file_type"],
+                "original_text": text,
+                "redacted_text": result["redacted_text"],
+                "document_metadata": document_response["metadata"]
+            }
+            return StreamingResponse(
+                _stream_redaction_result(header, result["matches"], result["summary"]),
+                media_type="application/x-ndjson"
+            )
+
+        return ORJSONResponse({
             "success": True,
             "filename": document_response["filename"],
             "file_type": document_response["file_type"],
             "original_text": text,
-            "redacted_text": redacted_text,
-            "matches": matches_data,
-            "summary": summary,
+            "redacted_text": result["redacted_text"],
+            "matches": result["matches"],
+            "summary": result["summary"],
             "document_metadata": document_response["metadata"]
-        }
+        })
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Document redaction failed: {str(e)}")
@@ -3,7 +3,7 @@ Configuration settings for the application.
 """
 
 from pydantic_settings import BaseSettings
-from typing import List
+from typing import Dict, List
 import os
 
 
@@ -19,6 +19,8 @@ class Settings(BaseSettings):
 
     # Redis
     REDIS_URL: str = "redis://localhost:6379"
+    RESULT_CACHE_ENABLED: bool = False  # Cached entries store document text unencrypted
+    RESULT_CACHE_TTL: int = 24 * 60 * 60  # 1 day
 
     # API Keys
     OPENAI_API_KEY: str = ""
@@ -42,6 +44,19 @@ class Settings(BaseSettings):
 
     # NLP Models
     SPACY_MODEL: str = "en_core_web_sm"
+    SPACY_BATCH_SIZE: int = 32
+    SPACY_N_PROCESS: int = 1
+    NER_BATCH_SIZE: int = 16
+    NER_MODEL: str = "elastic/distilbert-base-cased-finetuned-conll03-english"
+    HUGGINGFACE_CACHE_DIR: str = "./models"
+    NER_USE_ONNX: bool = False
+    NER_ONNX_DIR: str = "./models/ner-onnx-int8"
+    REDACTION_CONCURRENCY: int = 4
+    PARALLEL_ANALYSIS_MIN_CHARS: int = 10000
+    ANALYSIS_CACHE_MAX_CHARS: int = 2000
+
+    # Known entities always redacted, as {"term": "ENTITY_TYPE"}
+    KNOWN_ENTITIES: Dict[str, str] = {}
 
     class Config:
         env_file = ".env"
@@ -4,14 +4,18 @@ Main FastAPI application for the Intelligent Document Redaction Tool.
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 import uvicorn
+import asyncio
 import os
 from pathlib import Path
 
 from app.api import documents, redaction, audit
 from app.core.config import settings
 from app.core.database import engine
+from app.services.document_processor import shutdown_pdf_executor
 from app.models import Base
 
 # Create database tables
@@ -23,6 +27,7 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/api/docs",
     redoc_url="/api/redoc",
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware
@@ -34,11 +39,27 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger responses; redacted text is highly compressible
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # API routes
 app.include_router(documents.router, prefix="/api/documents", tags=["documents"])
 app.include_router(redaction.router, prefix="/api/redaction", tags=["redaction"])
 app.include_router(audit.router, prefix="/api/audit", tags=["audit"])
 
+# Warm up models at startup so the first request does not pay one-time costs
+@app.on_event("startup")
+async def warm_up_models():
+    """Run the NER models once on sample text."""
+    warmup_text = "Warm up " * 20
+    await asyncio.to_thread(redaction.redaction_service.find_entities_with_transformers, warmup_text)
+    await asyncio.to_thread(redaction.redaction_service.find_entities_with_spacy, warmup_text)
+
+@app.on_event("shutdown")
+async def stop_pdf_workers():
+    """Stop the PDF extraction worker processes."""
+    await asyncio.to_thread(shutdown_pdf_executor)
+
 # Health check endpoint
 @app.get("/api/health")
 async def health_check():
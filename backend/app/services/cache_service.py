@@ -0,0 +1,80 @@
+"""
+Result cache backed by Redis, keyed by content hashes.
+Lets re-uploaded documents and repeated redactions skip OCR and NER entirely.
+"""
+
+import hashlib
+from typing import Any, Optional
+
+import orjson
+import redis.asyncio as redis
+from redis.exceptions import RedisError
+
+from app.core.config import settings
+
+
+class ResultCache:
+    """
+    Stores extracted documents and redaction results in Redis.
+
+    Entries hold document text and matched entities in plaintext, so the cache
+    is disabled unless RESULT_CACHE_ENABLED is set. Cache failures never fail a request: lookups are treated as misses and
+    stores are skipped.
+    """
+
+    def __init__(self, url: Optional[str] = None, ttl: Optional[int] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            url: Redis URL (defaults to settings.REDIS_URL)
+            ttl: Expiry of cached entries in seconds (defaults to settings.RESULT_CACHE_TTL)
+        """
+        self.client = None
+        if settings.RESULT_CACHE_ENABLED:
+            self.client = redis.from_url(url or settings.REDIS_URL, socket_connect_timeout=1)
+        self.ttl = ttl or settings.RESULT_CACHE_TTL
+
+    @staticmethod
+    def document_key(content_digest: str) -> str:
+        """Key for an extracted document, given the SHA-256 hex digest of its bytes."""
+        return f"doc:{content_digest}"
+
+    @staticmethod
+    def redaction_key(text: str, redaction_char: str, config_fingerprint: str) -> str:
+        """
+        Key for the redaction of text with redaction_char.
+
+        config_fingerprint identifies the detection configuration (models, known
+        entities, patterns) so a configuration change never serves stale results.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(config_fingerprint.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(redaction_char.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(text.encode("utf-8", "surrogatepass"))
+        return f"redact:{digest.hexdigest()}"
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None on a miss."""
+        if self.client is None:
+            return None
+
+        try:
+            value = await self.client.get(key)
+        except RedisError as e:
+            print(f"Cache lookup failed: {e}")
+            return None
+
+        return orjson.loads(value) if value is not None else None
+
+    async def set(self, key: str, value: Any) -> None:
+        """Store value under key."""
+        if self.client is None:
+            return
+
+        try:
+            await self.client.set(key, orjson.dumps(value), ex=self.ttl)
+        except (RedisError, TypeError) as e:
+            print(f"Cache store failed: {e}")
@@ -5,17 +5,30 @@ Supports PDF, DOCX, TXT, and OCR for scanned documents.
 
 import os
 import io
+import multiprocessing
 from typing import Dict, List, Optional, Tuple
 from pathlib import Path
-import PyPDF2
 import pdfplumber
+import pypdfium2 as pdfium
 from docx import Document
 from PIL import Image
 import pytesseract
 import cv2
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
 
+# PDFs with fewer pages are extracted serially; worker startup would dominate
+PARALLEL_PDF_MIN_PAGES = 8
+
+# Resolution used when rendering PDF pages for OCR
+OCR_RENDER_DPI = 300
+
+# Shared pool for PDF page extraction, created on first use. Workers are spawned
+# rather than forked so they do not inherit the server's threads and loaded models.
+_pdf_executor: Optional[ProcessPoolExecutor] = None
+
 
 @dataclass
 class DocumentContent:
@@ -27,6 +40,62 @@ class DocumentContent:
     has_images: bool
 
 
+def _extract_pdf_pages(args: Tuple[str, int, int]) -> List[Tuple[str, bool]]:
+    """
+    Extract text from a range of PDF pages in a worker process.
+
+    Args:
+        args: Tuple of (file_path, first_page, end_page)
+
+    Returns:
+        List of (page_text, has_images) tuples
+    """
+    file_path, first_page, end_page = args
+    with pdfplumber.open(file_path) as pdf:
+        return [
+            (page.extract_text() or "", bool(page.images))
+            for page in pdf.pages[first_page:end_page]
+        ]
+
+
+def _get_pdf_executor() -> ProcessPoolExecutor:
+    """Return the shared PDF extraction pool, creating it on first use."""
+    global _pdf_executor
+    if _pdf_executor is None:
+        _pdf_executor = ProcessPoolExecutor(
+            max_workers=os.cpu_count() or 1,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _pdf_executor
+
+
+def _extract_pdf_ranges(ranges: List[Tuple[str, int, int]]) -> List[Tuple[str, bool]]:
+    """
+    Extract PDF page ranges in the shared pool.
+
+    A worker that dies leaves the pool permanently broken, so a broken pool is
+    discarded and the extraction retried once on a fresh one.
+    """
+    global _pdf_executor
+    executor = _get_pdf_executor()
+    try:
+        chunks = list(executor.map(_extract_pdf_pages, ranges))
+    except BrokenProcessPool:
+        if _pdf_executor is executor:
+            _pdf_executor = None
+        executor.shutdown(wait=False)
+        chunks = list(_get_pdf_executor().map(_extract_pdf_pages, ranges))
+    return [result for chunk in chunks for result in chunk]
+
+
+def shutdown_pdf_executor():
+    """Shut down the shared PDF extraction pool, if it was started."""
+    global _pdf_executor
+    if _pdf_executor is not None:
+        _pdf_executor.shutdown()
+        _pdf_executor = None
+
+
 class DocumentProcessor:
     """
     Service for processing various document formats and extracting text.
@@ -48,6 +117,8 @@ class DocumentProcessor:
         """
         Process a document and extract text content.
 
+        This blocks on file I/O and parsing; async callers should run it in an executor.
+
         Args:
             file_path: Path to the document file
 
@@ -92,29 +163,42 @@ class DocumentProcessor:
                     'creation_date': str(pdf.metadata.get('CreationDate', '')),
                 }
 
-                for page in pdf.pages:
-                    page_text = page.extract_text() or ""
+                page_count = len(pdf.pages)
+                if page_count >= PARALLEL_PDF_MIN_PAGES:
+                    # Extract contiguous page ranges in the shared worker processes
+                    workers = min(os.cpu_count() or 1, page_count)
+                    bounds = [page_count * i // workers for i in range(workers + 1)]
+                    ranges = [(str(file_path), bounds[i], bounds[i + 1]) for i in range(workers)]
+                    results = _extract_pdf_ranges(ranges)
+                else:
+                    results = [(page.extract_text() or "", bool(page.images)) for page in pdf.pages]
+
+                for page_text, page_has_images in results:
                     pages.append(page_text)
 
                     # Check for images
-                    if page.images:
+                    if page_has_images:
                         has_images = True
 
         except Exception as e:
-            # Fallback to PyPDF2
-            print(f"pdfplumber failed, trying PyPDF2: {e}")
+            # Fallback to pypdfium2 (PDFium)
+            print(f"pdfplumber failed, trying pypdfium2: {e}")
+            pages = []
             try:
-                with open(file_path, 'rb') as file:
-                    pdf_reader = PyPDF2.PdfReader(file)
+                pdf = pdfium.PdfDocument(str(file_path))
+                try:
+                    pdf_metadata = pdf.get_metadata_dict()
                     metadata = {
-                        'pages': len(pdf_reader.pages),
-                        'creator': pdf_reader.metadata.get('/Creator', '') if pdf_reader.metadata else '',
-                        'producer': pdf_reader.metadata.get('/Producer', '') if pdf_reader.metadata else '',
+                        'pages': len(pdf),
+                        'creator': pdf_metadata.get('Creator', ''),
+                        'producer': pdf_metadata.get('Producer', ''),
                     }
 
-                    for page in pdf_reader.pages:
-                        page_text = page.extract_text() or ""
+                    for index in range(len(pdf)):
+                        page_text = pdf[index].get_textpage().get_text_range()
                         pages.append(page_text)
+                finally:
+                    pdf.close()
 
             except Exception as e2:
                 raise Exception(f"Failed to process PDF with both libraries: {e2}")
@@ -134,3 +218,46 @@ class DocumentProcessor:
             file_type="pdf",
             has_images=has_images
         )
+
+    def _process_image(self, file_path: Path) -> DocumentContent:
+        """Process image files with OCR."""
+        # Decode straight to a grayscale array; no PIL round-trip
+        image = cv2.imdecode(np.fromfile(file_path, dtype=np.uint8), cv2.IMREAD_GRAYSCALE)
+        if image is None:
+            raise ValueError(f"Could not decode image: {file_path}")
+
+        height, width = image.shape
+        text = self._ocr_image(image)
+
+        return DocumentContent(
+            text=text,
+            pages=[text],
+            metadata={'width': width, 'height': height},
+            file_type="image",
+            has_images=True
+        )
+
+    def _ocr_pdf(self, file_path: Path) -> List[str]:
+        """Render each PDF page with PDFium and extract its text with OCR."""
+        pages = []
+        pdf = pdfium.PdfDocument(str(file_path))
+
+        try:
+            for index in range(len(pdf)):
+                bitmap = pdf[index].render(scale=OCR_RENDER_DPI / 72, grayscale=True)
+                pages.append(self._ocr_image(np.squeeze(bitmap.to_numpy())))
+        finally:
+            pdf.close()
+
+        return pages
+
+    def _ocr_image(self, image: np.ndarray) -> str:
+        """
+        Binarize a grayscale image and extract its text with Tesseract.
+
+        The image buffer is reused as the output of each preprocessing step.
+        """
+        image = cv2.GaussianBlur(image, (3, 3), 0, dst=image)
+        _, image = cv2.threshold(image, 0, 255, cv2.THRESH_BINARY | cv2.THRESH_OTSU, dst=image)
+
+        return pytesseract.image_to_string(image, config="--oem 1 --psm 6")
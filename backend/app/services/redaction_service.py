@@ -4,13 +4,81 @@ No external API keys required.
 """
 
 import re
+import asyncio
+import hashlib
+import threading
 import spacy
+import numpy as np
 from typing import List, Dict, Tuple, Optional
 from transformers import AutoTokenizer, AutoModelForTokenClassification, pipeline
 import torch
-from dataclasses import dataclass
+import orjson
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from operator import attrgetter
+from pathlib import Path
 from enum import Enum
 
+from app.core.config import settings
+
+try:
+    # Optional linear-time (DFA) regex engine; falls back to Python's re
+    import re2
+except ImportError:
+    re2 = None
+
+try:
+    # Optional Aho-Corasick automaton for known-entity deny-lists
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Texts shorter than this skip the transformer NER pass
+TRANSFORMER_MIN_CHARS = 200
+
+# Capitalized multi-word span; a necessary condition for PER/ORG names
+NAME_CANDIDATE_PATTERN = re.compile(r"\b[A-Z][a-z]+\s+[A-Z][a-z]+\b")
+
+# Every regex pattern except EMAIL needs a digit; texts without one skip them
+DIGIT_PATTERN = re.compile(r"\d")
+
+# Characters on which re2's ASCII-only \d, \w and \s classes disagree with re's
+RE2_INCOMPATIBLE_PATTERN = re.compile(r"[^\x00-\x0a\x0c-\x1b\x20-\x7f]")
+
+# A leading \b followed by a single word-character atom, e.g. \b\d{3} or \b4
+LEADING_BOUNDARY_PATTERN = re.compile(r"\\b(\\d|[0-9A-Za-z])(?:\{(\d+)(?:,(\d*))?\}|(\+))?(?![?+])")
+
+
+def _hoist_word_boundary(source: str) -> str:
+    """
+    Rewrite a leading \b<atom> as <atom>(?<!\w<atom>), which matches the same text.
+
+    A pattern that starts with \b gives re nothing to skip ahead with, so it is
+    tried at every position; one that starts with a digit or literal is only
+    tried where that character occurs. The lookbehind checks the character
+    before the atom instead, so the matches are unchanged.
+    """
+    match = LEADING_BOUNDARY_PATTERN.match(source)
+    if not match:
+        return source
+
+    atom, low, high, plus = match.groups()
+    rest = ""
+    if low is not None:
+        low = int(low)
+        if low == 0:
+            return source
+        if high is None:
+            rest = f"{atom}{{{low - 1}}}" if low > 1 else ""
+        elif high == "":
+            rest = f"{atom}{{{low - 1},}}"
+        else:
+            rest = f"{atom}{{{low - 1},{int(high) - 1}}}"
+    elif plus:
+        rest = f"{atom}*"
+
+    return f"{atom}(?<!\\w{atom}){rest}{source[match.end():]}"
+
 
 class EntityType(Enum):
     """Types of entities that can be redacted."""
@@ -26,7 +94,7 @@ class EntityType(Enum):
     MEDICAL = "MEDICAL"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RedactionMatch:
     """Represents a match found for redaction."""
     text: str
@@ -34,42 +102,188 @@ class RedactionMatch:
     end: int
     entity_type: EntityType
     confidence: float
-    method: str  # 'spacy', 'regex', 'transformer'
+    method: str  # 'spacy', 'regex', 'transformer', 'literal'
+
+
+ENTITY_TYPES = list(EntityType)
+MATCH_METHODS = ["spacy", "regex", "transformer", "literal"]
+
+
+@dataclass
+class MatchArray:
+    """
+    Struct-of-arrays representation of a list of matches.
+
+    Used internally so merging and summarizing run as vectorized NumPy operations;
+    convert back with to_matches() at the API boundary.
+    """
+    starts: np.ndarray  # int32
+    ends: np.ndarray  # int32
+    entity_type_ids: np.ndarray  # int8, index into ENTITY_TYPES
+    confidences: np.ndarray  # float64
+    method_ids: np.ndarray  # int8, index into MATCH_METHODS
+    texts: List[str]
+
+    @classmethod
+    def from_matches(cls, matches: List[RedactionMatch]) -> "MatchArray":
+        """Build a MatchArray from a list of matches."""
+        return cls(
+            starts=np.fromiter((m.start for m in matches), dtype=np.int32, count=len(matches)),
+            ends=np.fromiter((m.end for m in matches), dtype=np.int32, count=len(matches)),
+            entity_type_ids=np.fromiter(
+                (ENTITY_TYPES.index(m.entity_type) for m in matches), dtype=np.int8, count=len(matches)
+            ),
+            confidences=np.fromiter((m.confidence for m in matches), dtype=np.float64, count=len(matches)),
+            method_ids=np.fromiter(
+                (MATCH_METHODS.index(m.method) for m in matches), dtype=np.int8, count=len(matches)
+            ),
+            texts=[m.text for m in matches]
+        )
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def to_matches(self, indices: Optional[np.ndarray] = None) -> List[RedactionMatch]:
+        """Convert (a selection of) the arrays back into RedactionMatch objects."""
+        if indices is None:
+            indices = np.arange(len(self))
+
+        return [
+            RedactionMatch(
+                text=self.texts[i],
+                start=start,
+                end=end,
+                entity_type=ENTITY_TYPES[entity_type_id],
+                confidence=confidence,
+                method=MATCH_METHODS[method_id]
+            )
+            for i, start, end, entity_type_id, confidence, method_id in zip(
+                indices.tolist(),
+                self.starts[indices].tolist(),
+                self.ends[indices].tolist(),
+                self.entity_type_ids[indices].tolist(),
+                self.confidences[indices].tolist(),
+                self.method_ids[indices].tolist()
+            )
+        ]
 
 
 class OpenSourceRedactionService:
     """
     Document redaction service using only open-source models and libraries.
+
+    The service is a per-process singleton so the models are loaded only once.
     """
 
+    _instance: Optional["OpenSourceRedactionService"] = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
     def __init__(self):
+        if self._initialized:
+            return
+
         self.spacy_model = None
         self.ner_pipeline = None
+        # spaCy pipelines and HF fast tokenizers are not thread-safe
+        self.model_lock = threading.Lock()
         self.regex_patterns = self._compile_regex_patterns()
+        self.regex_scanners = self._build_regex_scanners(self.regex_patterns)
+        self.re2_scanners = self._build_re2_scanners(self.regex_patterns)
+        self.literal_matcher = self._build_literal_matcher(settings.KNOWN_ENTITIES)
+        self.config_fingerprint = self._config_fingerprint()
         self._load_models()
+        self._initialized = True
 
     def _load_models(self):
         """Load spaCy and transformer models."""
         try:
-            # Load spaCy model
-            self.spacy_model = spacy.load("en_core_web_sm")
+            # Load spaCy model; only the NER component is used
+            self.spacy_model = spacy.load(
+                settings.SPACY_MODEL,
+                exclude=["tagger", "parser", "attribute_ruler", "lemmatizer"]
+            )
         except OSError:
-            print("spaCy model not found. Please install: python -m spacy download en_core_web_sm")
+            print(f"spaCy model not found. Please install: python -m spacy download {settings.SPACY_MODEL}")
+
+        if settings.SPACY_MODEL.endswith("_trf"):
+            # The spaCy transformer pipeline already covers PERSON/ORG/LOC
+            return
 
         try:
-            # Load transformer-based NER model (BERT-based)
-            model_name = "dbmdz/bert-large-cased-finetuned-conll03-english"
+            # Load transformer-based NER model (DistilBERT fine-tuned on CoNLL-03)
+            model_name = settings.NER_MODEL
+            use_cuda = torch.cuda.is_available()
+            tokenizer = AutoTokenizer.from_pretrained(
+                model_name,
+                cache_dir=settings.HUGGINGFACE_CACHE_DIR
+            )
+            model = None
+            if settings.NER_USE_ONNX and not use_cuda:
+                try:
+                    model = self._load_onnx_model(model_name)
+                except Exception as e:
+                    print(f"Could not load ONNX Runtime model, using PyTorch: {e}")
+
+            if model is None:
+                if not use_cuda:
+                    dtype = torch.float32
+                elif torch.cuda.is_bf16_supported():
+                    dtype = torch.bfloat16
+                else:
+                    # Pre-Ampere GPUs emulate bf16 slowly; fp16 runs natively
+                    dtype = torch.float16
+                model = AutoModelForTokenClassification.from_pretrained(
+                    model_name,
+                    cache_dir=settings.HUGGINGFACE_CACHE_DIR,
+                    torch_dtype=dtype
+                )
+                model.eval()
             self.ner_pipeline = pipeline(
                 "ner",
-                model=model_name,
-                tokenizer=model_name,
+                model=model,
+                tokenizer=tokenizer,
                 aggregation_strategy="simple",
-                device=0 if torch.cuda.is_available() else -1
+                device=0 if use_cuda else -1
             )
         except Exception as e:
             print(f"Could not load transformer model: {e}")
             self.ner_pipeline = None
 
+    def _load_onnx_model(self, model_name: str):
+        """
+        Load an int8-quantized ONNX Runtime version of the NER model.
+
+        On first use the model is exported to ONNX, dynamically quantized and
+        saved to a subdirectory of NER_ONNX_DIR named after the model; later
+        loads read the saved model, so changing NER_MODEL triggers a new export.
+        """
+        from optimum.onnxruntime import ORTModelForTokenClassification, ORTQuantizer
+        from optimum.onnxruntime.configuration import AutoQuantizationConfig
+
+        onnx_dir = Path(settings.NER_ONNX_DIR) / model_name.replace("/", "--")
+        if not (onnx_dir / "model_quantized.onnx").exists():
+            onnx_model = ORTModelForTokenClassification.from_pretrained(
+                model_name,
+                export=True,
+                cache_dir=settings.HUGGINGFACE_CACHE_DIR
+            )
+            quantizer = ORTQuantizer.from_pretrained(onnx_model)
+            quantizer.quantize(
+                save_dir=onnx_dir,
+                quantization_config=AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False)
+            )
+
+        return ORTModelForTokenClassification.from_pretrained(
+            onnx_dir,
+            file_name="model_quantized.onnx",
+            provider="CPUExecutionProvider"
+        )
+
     def _compile_regex_patterns(self) -> Dict[EntityType, List[re.Pattern]]:
         """Compile regex patterns for different entity types."""
         patterns = {
@@ -107,69 +321,284 @@ class OpenSourceRedactionService:
         }
         return patterns
 
+    def _build_regex_scanners(
+        self, patterns: Dict[EntityType, List[re.Pattern]], compile_pattern=None
+    ) -> List[Tuple[EntityType, re.Pattern, Optional[str]]]:
+        """
+        Compile the regex patterns for scanning.
+
+        By default each pattern is compiled with re, with its leading word boundary
+        hoisted (see _hoist_word_boundary). The third element of each entry is a
+        character the pattern cannot match without ('@' for EMAIL, '$' for currency
+        amounts), or None if it only needs a digit.
+
+        Args:
+            patterns: Patterns per entity type
+            compile_pattern: Optional function compiling a pattern for another engine
+        """
+        if compile_pattern is None:
+            compile_pattern = lambda pattern: re.compile(_hoist_word_boundary(pattern.pattern), pattern.flags)
+
+        scanners = []
+
+        for entity_type, entity_patterns in patterns.items():
+            for pattern in entity_patterns:
+                if entity_type == EntityType.EMAIL:
+                    sentinel = "@"
+                elif pattern.pattern.startswith(r"\$"):
+                    sentinel = "$"
+                else:
+                    sentinel = None
+                scanners.append((entity_type, compile_pattern(pattern), sentinel))
+
+        return scanners
+
+    def _build_re2_scanners(
+        self, patterns: Dict[EntityType, List[re.Pattern]]
+    ) -> Optional[List[Tuple[EntityType, re.Pattern, Optional[str]]]]:
+        """
+        Compile the regex patterns with re2, if it is installed.
+
+        re2 matches in linear time, but its wrapper re-encodes the text on every
+        search() or match() call, so the patterns are only ever run through
+        finditer(). Word boundaries stay in place, since re2 has no lookbehind.
+        """
+        if re2 is None:
+            return None
+
+        def compile_pattern(pattern: re.Pattern):
+            source = pattern.pattern
+            if pattern.flags & re.IGNORECASE:
+                source = f"(?i:{source})"
+            return re2.compile(source)
+
+        try:
+            return self._build_regex_scanners(patterns, compile_pattern)
+        except re2.error as e:
+            print(f"Could not compile regex patterns with re2, using re: {e}")
+            return None
+
+    def _config_fingerprint(self) -> str:
+        """
+        Hash of the configuration that determines what gets detected.
+
+        Cached results are keyed by it, so changing models, known entities or
+        regex patterns does not serve results computed under the old configuration.
+        """
+        config = {
+            "spacy_model": settings.SPACY_MODEL,
+            "ner_model": settings.NER_MODEL,
+            "ner_onnx_dir": settings.NER_ONNX_DIR if settings.NER_USE_ONNX else None,
+            "known_entities": sorted(settings.KNOWN_ENTITIES.items()),
+            "regex_patterns": [
+                [entity_type.name, pattern.pattern, int(pattern.flags)]
+                for entity_type, entity_patterns in self.regex_patterns.items()
+                for pattern in entity_patterns
+            ],
+        }
+        return hashlib.blake2b(orjson.dumps(config), digest_size=8).hexdigest()
+
+    def _build_literal_matcher(self, known_entities: Dict[str, str]):
+        """
+        Build a matcher for known entity terms (e.g. a company-name deny-list).
+
+        Uses a pyahocorasick automaton, so matching is linear in the text length
+        regardless of the number of terms; falls back to an escaped regex union.
+
+        Args:
+            known_entities: Mapping of literal term to EntityType value
+
+        Returns:
+            The matcher, or None if there are no known entities
+        """
+        if not known_entities:
+            return None
+
+        entries = {term: EntityType(value) for term, value in known_entities.items() if term}
+
+        if ahocorasick is not None:
+            automaton = ahocorasick.Automaton()
+            for term, entity_type in entries.items():
+                automaton.add_word(term, (term, entity_type))
+            automaton.make_automaton()
+            return automaton
+
+        # Longest terms first so the alternation prefers them
+        terms = sorted(entries, key=len, reverse=True)
+        return re.compile("|".join(re.escape(term) for term in terms)), entries
+
+    def _split_paragraphs(self, text: str) -> List[Tuple[int, str]]:
+        """Split text on paragraph boundaries, keeping each chunk's character offset."""
+        chunks = []
+        offset = 0
+
+        for paragraph in text.split("\n\n"):
+            if paragraph.strip():
+                chunks.append((offset, paragraph))
+            offset += len(paragraph) + 2
+
+        return chunks
+
     def find_entities_with_spacy(self, text: str) -> List[RedactionMatch]:
         """Find entities using spaCy NER."""
-        if not self.spacy_model:
+        return self.find_entities_with_spacy_batch(self._split_paragraphs(text))
+
+    def find_entities_with_spacy_batch(self, chunks: List[Tuple[int, str]]) -> List[RedactionMatch]:
+        """
+        Find entities in a batch of text chunks using spaCy's nlp.pipe().
+
+        Args:
+            chunks: List of (offset, text) tuples; offsets are added to match positions
+
+        Returns:
+            List of matches positioned relative to the original text
+        """
+        if not self.spacy_model or not chunks:
             return []
 
-        doc = self.spacy_model(text)
+        texts = [chunk for _, chunk in chunks]
+        with self.model_lock:
+            docs = list(self.spacy_model.pipe(texts, batch_size=settings.SPACY_BATCH_SIZE, n_process=settings.SPACY_N_PROCESS))
         matches = []
 
-        for ent in doc.ents:
-            entity_type = self._map_spacy_label(ent.label_)
-            if entity_type:
-                matches.append(RedactionMatch(
-                    text=ent.text,
-                    start=ent.start_char,
-                    end=ent.end_char,
-                    entity_type=entity_type,
-                    confidence=0.8,  # spaCy doesn't provide confidence scores
-                    method="spacy"
-                ))
+        for (offset, _), doc in zip(chunks, docs):
+            for ent in doc.ents:
+                entity_type = self._map_spacy_label(ent.label_)
+                if entity_type:
+                    matches.append(RedactionMatch(
+                        text=ent.text,
+                        start=offset + ent.start_char,
+                        end=offset + ent.end_char,
+                        entity_type=entity_type,
+                        confidence=0.8,  # spaCy doesn't provide confidence scores
+                        method="spacy"
+                    ))
 
         return matches
 
     def find_entities_with_transformers(self, text: str) -> List[RedactionMatch]:
         """Find entities using transformer-based NER."""
-        if not self.ner_pipeline:
+        return self.find_entities_with_transformers_batch(self._split_paragraphs(text))
+
+    def find_entities_with_transformers_batch(self, chunks: List[Tuple[int, str]]) -> List[RedactionMatch]:
+        """
+        Find entities in a batch of text chunks using the batched transformer pipeline.
+
+        Args:
+            chunks: List of (offset, text) tuples; offsets are added to match positions
+
+        Returns:
+            List of matches positioned relative to the original text
+        """
+        if not self.ner_pipeline or not chunks:
             return []
 
         try:
-            results = self.ner_pipeline(text)
+            texts = [chunk for _, chunk in chunks]
+            with self.model_lock, torch.inference_mode():
+                batch_results = self.ner_pipeline(texts, batch_size=settings.NER_BATCH_SIZE)
             matches = []
 
-            for result in results:
-                entity_type = self._map_transformer_label(result['entity_group'])
-                if entity_type:
-                    matches.append(RedactionMatch(
-                        text=result['word'],
-                        start=result['start'],
-                        end=result['end'],
-                        entity_type=entity_type,
-                        confidence=result['score'],
-                        method="transformer"
-                    ))
+            for (offset, _), results in zip(chunks, batch_results):
+                for result in results:
+                    entity_type = self._map_transformer_label(result['entity_group'])
+                    if entity_type:
+                        matches.append(RedactionMatch(
+                            text=result['word'],
+                            start=offset + result['start'],
+                            end=offset + result['end'],
+                            entity_type=entity_type,
+                            confidence=result['score'],
+                            method="transformer"
+                        ))
 
             return matches
         except Exception as e:
             print(f"Error in transformer NER: {e}")
             return []
 
+    def _should_run_transformer(self, text: str, spacy_matches: List[RedactionMatch]) -> bool:
+        """
+        Decide whether the transformer NER pass is worth running.
+
+        It is skipped for short texts, texts without capitalized multi-word spans,
+        and texts where spaCy already found at least one PERSON/ORG per 500 chars.
+        """
+        if not self.ner_pipeline or len(text) < TRANSFORMER_MIN_CHARS:
+            return False
+
+        if not NAME_CANDIDATE_PATTERN.search(text):
+            return False
+
+        name_matches = sum(
+            1 for match in spacy_matches
+            if match.entity_type in (EntityType.PERSON, EntityType.ORGANIZATION)
+        )
+        return name_matches < len(text) / 500
+
     def find_entities_with_regex(self, text: str) -> List[RedactionMatch]:
         """Find entities using regex patterns."""
         matches = []
+        has_digit = DIGIT_PATTERN.search(text) is not None
+
+        scanners = self.regex_scanners
+        if self.re2_scanners is not None and RE2_INCOMPATIBLE_PATTERN.search(text) is None:
+            scanners = self.re2_scanners
+
+        for entity_type, pattern, sentinel in scanners:
+            # Skip patterns whose required characters do not occur in the text
+            if sentinel == "@":
+                if sentinel not in text:
+                    continue
+            elif not has_digit or (sentinel is not None and sentinel not in text):
+                continue
+
+            for match in pattern.finditer(text):
+                start, end = match.span()
+                matches.append(RedactionMatch(
+                    text=match.group(),
+                    start=start,
+                    end=end,
+                    entity_type=entity_type,
+                    confidence=0.9,  # High confidence for regex matches
+                    method="regex"
+                ))
 
-        for entity_type, patterns in self.regex_patterns.items():
-            for pattern in patterns:
-                for match in pattern.finditer(text):
-                    matches.append(RedactionMatch(
-                        text=match.group(),
-                        start=match.start(),
-                        end=match.end(),
-                        entity_type=entity_type,
-                        confidence=0.9,  # High confidence for regex matches
-                        method="regex"
-                    ))
+        matches.extend(self.find_entities_with_literals(text))
+
+        return matches
+
+    def find_entities_with_literals(self, text: str) -> List[RedactionMatch]:
+        """Find occurrences of known entity terms at word boundaries."""
+        if self.literal_matcher is None:
+            return []
+
+        if ahocorasick is not None:
+            occurrences = (
+                (end_index - len(term) + 1, end_index + 1, term, entity_type)
+                for end_index, (term, entity_type) in self.literal_matcher.iter(text)
+            )
+        else:
+            pattern, entries = self.literal_matcher
+            occurrences = (
+                (match.start(), match.end(), match.group(), entries[match.group()])
+                for match in pattern.finditer(text)
+            )
+
+        matches = []
+        for start, end, term, entity_type in occurrences:
+            # Skip terms embedded in longer words
+            if (start > 0 and text[start - 1].isalnum()) or (end < len(text) and text[end].isalnum()):
+                continue
+
+            matches.append(RedactionMatch(
+                text=term,
+                start=start,
+                end=end,
+                entity_type=entity_type,
+                confidence=1.0,  # Exact match against a known entity
+                method="literal"
+            ))
 
         return matches
 
@@ -196,30 +625,115 @@ class OpenSourceRedactionService:
         return mapping.get(label)
 
     def merge_overlapping_matches(self, matches: List[RedactionMatch]) -> List[RedactionMatch]:
-        """Merge overlapping matches, keeping the one with higher confidence."""
+        """
+        Merge overlapping matches, keeping the one with higher confidence.
+
+        Matches that overlap directly or transitively form a cluster. The best
+        match of a cluster, by confidence and then by span length, is kept and
+        the matches overlapping it are dropped; the rest of the cluster is then
+        resolved the same way, so a match that does not overlap a winner is kept.
+        """
         if not matches:
             return []
 
-        # Sort by start position
-        sorted_matches = sorted(matches, key=lambda x: x.start)
-        merged = [sorted_matches[0]]
+        # Sort by start position; singleton clusters skip resolution entirely
+        sorted_matches = sorted(matches, key=attrgetter("start"))
+        merged = []
+        last = sorted_matches[0]
+        cluster = None
+        cluster_end = last.end
 
         for current in sorted_matches[1:]:
-            last = merged[-1]
-
-            # Check for overlap
-            if current.start < last.end:
-                # Keep the match with higher confidence
-                if current.confidence > last.confidence:
-                    merged[-1] = current
-                # If same confidence, keep the longer match
-                elif current.confidence == last.confidence and (current.end - current.start) > (last.end - last.start):
-                    merged[-1] = current
+            if current.start < cluster_end:
+                if cluster is None:
+                    cluster = [last]
+                cluster.append(current)
+                if current.end > cluster_end:
+                    cluster_end = current.end
+                continue
+
+            if cluster is None:
+                merged.append(last)
             else:
-                merged.append(current)
-
+                merged.extend(self._resolve_cluster(cluster))
+                cluster = None
+            last = current
+            cluster_end = current.end
+
+        if cluster is None:
+            merged.append(last)
+        else:
+            merged.extend(self._resolve_cluster(cluster))
         return merged
 
+    def _resolve_cluster(self, cluster: List[RedactionMatch]) -> List[RedactionMatch]:
+        """
+        Pick non-overlapping winners from one cluster of overlapping matches.
+
+        The best remaining match (by confidence, then length, then earliest
+        position) wins, matches overlapping it are dropped, and the process
+        repeats on what is left. Winners are returned in cluster order.
+        """
+        if len(cluster) == 2:
+            first, second = cluster
+            if (second.confidence, second.end - second.start) > (first.confidence, first.end - first.start):
+                return [second]
+            return [first]
+
+        ranking = sorted(
+            range(len(cluster)),
+            key=lambda i: (-cluster[i].confidence, cluster[i].start - cluster[i].end, i)
+        )
+        winners = []
+
+        for position in ranking:
+            candidate = cluster[position]
+            if all(candidate.end <= cluster[w].start or candidate.start >= cluster[w].end for w in winners):
+                winners.append(position)
+
+        return [cluster[position] for position in sorted(winners)]
+
+    def find_all_entities(self, text: str) -> List[RedactionMatch]:
+        """
+        Find entities using all methods and merge overlapping matches.
+
+        The text is split into paragraphs so the NER models can process it in batches.
+
+        Args:
+            text: Input text to analyze
+
+        Returns:
+            List of merged matches
+        """
+        if len(text) <= settings.ANALYSIS_CACHE_MAX_CHARS:
+            return list(self._analyze_short(text))
+
+        return self._find_all_entities(text)
+
+    @lru_cache(maxsize=1024)
+    def _analyze_short(self, text: str) -> Tuple[RedactionMatch, ...]:
+        """Cached analysis for short texts, which are often re-analyzed verbatim."""
+        return tuple(self._find_all_entities(text))
+
+    def _find_all_entities(self, text: str) -> List[RedactionMatch]:
+        """Run all detection methods on text and merge the results."""
+        all_matches = self._find_model_entities(text)
+        all_matches.extend(self.find_entities_with_regex(text))
+
+        # Merge overlapping matches
+        return self.merge_overlapping_matches(all_matches)
+
+    def _find_model_entities(self, text: str) -> List[RedactionMatch]:
+        """Run the spaCy and transformer models on text in paragraph batches."""
+        chunks = self._split_paragraphs(text)
+        all_matches = []
+
+        spacy_matches = self.find_entities_with_spacy_batch(chunks)
+        all_matches.extend(spacy_matches)
+        if self._should_run_transformer(text, spacy_matches):
+            all_matches.extend(self.find_entities_with_transformers_batch(chunks))
+        return all_matches
+
     def redact_text(self, text: str, redaction_char: str = "█") -> Tuple[str, List[RedactionMatch]]:
         """
         Redact sensitive information from text.
@@ -231,23 +745,98 @@ class OpenSourceRedactionService:
         Returns:
             Tuple of (redacted_text, list_of_matches)
         """
-        all_matches = []
+        final_matches = self.find_all_entities(text)
+        return self._apply_redactions(text, final_matches, redaction_char), final_matches
 
-        # Find entities using all methods
-        all_matches.extend(self.find_entities_with_spacy(text))
-        all_matches.extend(self.find_entities_with_transformers(text))
-        all_matches.extend(self.find_entities_with_regex(text))
+    def _apply_redactions(self, text: str, matches: List[RedactionMatch], redaction_char: str) -> str:
+        """Replace each matched span with redaction characters in a single pass."""
+        parts = []
+        cursor = 0
+        redaction_cache: Dict[int, str] = {}
 
-        # Merge overlapping matches
-        final_matches = self.merge_overlapping_matches(all_matches)
+        for match in sorted(matches, key=attrgetter("start")):
+            length = match.end - match.start
+            redaction = redaction_cache.get(length)
+            if redaction is None:
+                redaction = redaction_cache[length] = redaction_char * length
+
+            parts.append(text[cursor:match.start])
+            parts.append(redaction)
+            cursor = match.end
 
-        # Apply redactions (work backwards to maintain positions)
-        redacted_text = text
-        for match in sorted(final_matches, key=lambda x: x.start, reverse=True):
-            redaction = redaction_char * len(match.text)
-            redacted_text = redacted_text[:match.start] + redaction + redacted_text[match.end:]
+        parts.append(text[cursor:])
+        return "".join(parts)
 
-        return redacted_text, final_matches
+    def split_pages(self, text: str, max_chars: int) -> List[str]:
+        """
+        Group paragraphs into pages of roughly max_chars characters.
+
+        Joining the returned pages with "\n\n" reproduces the original text.
+        """
+        pages = []
+        current = []
+        current_length = 0
+
+        for paragraph in text.split("\n\n"):
+            if current and current_length + len(paragraph) > max_chars:
+                pages.append("\n\n".join(current))
+                current = []
+                current_length = 0
+            current.append(paragraph)
+            current_length += len(paragraph) + 2
+
+        pages.append("\n\n".join(current))
+        return pages
+
+    async def analyze_pages(self, pages: List[str]) -> List[RedactionMatch]:
+        """
+        Find entities in a multi-page document.
+
+        The NER models run once over the whole document so their inputs stay
+        batched; regex matching runs per page in worker threads, bounded by
+        REDACTION_CONCURRENCY, alongside it.
+
+        Args:
+            pages: Page texts of a document
+
+        Returns:
+            Merged matches positioned relative to "\n\n".join(pages)
+        """
+        text = "\n\n".join(pages)
+        semaphore = asyncio.Semaphore(settings.REDACTION_CONCURRENCY)
+
+        async def scan_page(page: str) -> List[RedactionMatch]:
+            async with semaphore:
+                return await asyncio.to_thread(self.find_entities_with_regex, page)
+
+        model_matches, *page_matches = await asyncio.gather(
+            asyncio.to_thread(self._find_model_entities, text),
+            *(scan_page(page) for page in pages)
+        )
+
+        all_matches = model_matches
+        offset = 0
+        for page, matches in zip(pages, page_matches):
+            for match in matches:
+                all_matches.append(replace(match, start=offset + match.start, end=offset + match.end))
+            offset += len(page) + 2
+
+        return self.merge_overlapping_matches(all_matches)
+
+    async def redact_pages(self, pages: List[str], redaction_char: str = "█") -> Tuple[str, List[RedactionMatch]]:
+        """
+        Redact a multi-page document, analyzing pages concurrently.
+
+        Args:
+            pages: Page texts of a document
+            redaction_char: Character to use for redaction
+
+        Returns:
+            Tuple of (redacted_text, list_of_matches) for "\n\n".join(pages)
+        """
+        text = "\n\n".join(pages)
+        final_matches = await self.analyze_pages(pages)
+        return self._apply_redactions(text, final_matches, redaction_char), final_matches
 
     def get_redaction_summary(self, matches: List[RedactionMatch]) -> Dict:
         """Generate a summary of redacted entities."""
@@ -265,18 +854,21 @@ class OpenSourceRedactionService:
         if not matches:
             return summary
 
-        # Count by type
-        for match in matches:
-            entity_type = match.entity_type.value
-            summary["by_type"][entity_type] = summary["by_type"].get(entity_type, 0) + 1
+        match_array = MatchArray.from_matches(matches)
+
+        # Count by type and method
+        type_counts = np.bincount(match_array.entity_type_ids, minlength=len(ENTITY_TYPES))
+        for entity_type_id in np.flatnonzero(type_counts).tolist():
+            summary["by_type"][ENTITY_TYPES[entity_type_id].value] = int(type_counts[entity_type_id])
 
-            method = match.method
-            summary["by_method"][method] = summary["by_method"].get(method, 0) + 1
+        method_counts = np.bincount(match_array.method_ids, minlength=len(MATCH_METHODS))
+        for method_id in np.flatnonzero(method_counts).tolist():
+            summary["by_method"][MATCH_METHODS[method_id]] = int(method_counts[method_id])
 
         # Calculate confidence statistics
-        confidences = [match.confidence for match in matches]
-        summary["confidence_stats"]["average"] = sum(confidences) / len(confidences)
-        summary["confidence_stats"]["min"] = min(confidences)
-        summary["confidence_stats"]["max"] = max(confidences)
+        confidences = match_array.confidences
+        summary["confidence_stats"]["average"] = float(confidences.mean())
+        summary["confidence_stats"]["min"] = float(confidences.min())
+        summary["confidence_stats"]["max"] = float(confidences.max())
 
         return summary
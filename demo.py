@@ -6,8 +6,11 @@ No external dependencies required - uses only Python standard library!
 
 import re
 import sys
-from typing import List, Tuple, Dict
-from dataclasses import dataclass
+import functools
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Tuple, Dict, Optional
+from dataclasses import dataclass, replace
 from enum import Enum
 
 
@@ -21,7 +24,7 @@ class EntityType(Enum):
     FINANCIAL = "FINANCIAL"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RedactionMatch:
     """Represents a match found for redaction."""
     text: str
@@ -31,6 +34,171 @@ class RedactionMatch:
     confidence: float
 
 
+# (entity type, pattern) pairs; each pattern is scanned on its own, so
+# matches of different patterns may overlap
+PATTERNS: List[Tuple[EntityType, str]] = [
+    (EntityType.EMAIL, r'(?i:\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b)'),
+    (EntityType.SSN, r'\b\d{3}[-.\s]?\d{2}[-.\s]?\d{4}\b'),
+    (EntityType.CREDIT_CARD, r'\b4[0-9]{12}(?:[0-9]{3})?\b'),  # Visa
+    (EntityType.CREDIT_CARD, r'\b5[1-5][0-9]{14}\b'),  # MasterCard
+    (EntityType.CREDIT_CARD, r'\b3[47][0-9]{13}\b'),  # American Express
+    (EntityType.CREDIT_CARD, r'\b6(?:011|5[0-9]{2})[0-9]{12}\b'),  # Discover
+    (EntityType.CREDIT_CARD, r'\b\d{4}[-\s]?(?:\d{4}[-\s]?){2}\d{4}\b'),  # Generic format
+    (EntityType.PHONE, r'\b(?:\+?1[-.\s]?)?\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}\b'),
+    (EntityType.PHONE, r'\b\d{3}[-.\s]?\d{3}[-.\s]?\d{4}\b'),
+    (EntityType.PHONE, r'\(\d{3}\)\s?\d{3}[-.\s]?\d{4}'),
+    (EntityType.DATE, r'\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b'),
+    (EntityType.DATE, r'\b\d{2,4}[/-]\d{1,2}[/-]\d{1,2}\b'),
+    (EntityType.DATE, r'(?i:\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{1,2},?\s+\d{2,4}\b)'),
+    (EntityType.FINANCIAL, r'\$\s?\d{1,3}(?>(?:,\d{3})*)(?>(?:\.\d{2})?)'),
+    (EntityType.FINANCIAL, r'\b\d{1,3}(?>(?:,\d{3})*)(?>(?:\.\d{2})?)\s?(?i:USD|dollars?)\b'),
+    (EntityType.FINANCIAL, r'(?i:\b(?:account|acct)\.?\s?#?\s?\d+\b)'),
+    (EntityType.FINANCIAL, r'(?i:\b(?:routing|rt)\.?\s?#?\s?\d{9}\b)'),
+]
+
+ALL_PATTERN_IDS = tuple(range(len(PATTERNS)))
+
+# Atomic groups (?>...) keep the amount patterns from backtracking; stdlib re
+# only supports them from Python 3.11
+SUPPORTS_ATOMIC_GROUPS = sys.version_info >= (3, 11)
+
+
+def _without_atomic_groups(pattern: str) -> str:
+    """Rewrite atomic groups as plain non-capturing ones, which match the same text here."""
+    return pattern.replace("(?>", "(?:")
+
+
+LEADING_BOUNDARY_PATTERN = re.compile(r"\\b(\\d|[0-9A-Za-z])(?:\{(\d+)(?:,(\d*))?\}|(\+))?(?![?+])")
+
+
+def _hoist_word_boundary(pattern: str) -> str:
+    """
+    Rewrite a leading \\b<atom> as <atom>(?<!\\w<atom>), which matches the same text.
+
+    A pattern that starts with \\b is tried at every position, while one that
+    starts with a digit or literal is only tried where that character occurs.
+    """
+    match = LEADING_BOUNDARY_PATTERN.match(pattern)
+    if not match:
+        return pattern
+
+    atom, low, high, plus = match.groups()
+    rest = ""
+    if low is not None:
+        low = int(low)
+        if low == 0:
+            return pattern
+        if high is None:
+            rest = f"{atom}{{{low - 1}}}" if low > 1 else ""
+        elif high == "":
+            rest = f"{atom}{{{low - 1},}}"
+        else:
+            rest = f"{atom}{{{low - 1},{int(high) - 1}}}"
+    elif plus:
+        rest = f"{atom}*"
+
+    return f"{atom}(?<!\\w{atom}){rest}{pattern[match.end():]}"
+
+
+# Characters a pattern cannot match without: every pattern but EMAIL needs a
+# digit, EMAIL needs '@' and the currency-symbol pattern needs '$'
+EMAIL_PATTERN_IDS = frozenset(i for i, (entity_type, _) in enumerate(PATTERNS) if entity_type is EntityType.EMAIL)
+DOLLAR_PATTERN_IDS = frozenset(i for i, (_, pattern) in enumerate(PATTERNS) if pattern.startswith(r'\$'))
+
+_has_digit = re.compile(r'\d').search
+
+# In str patterns \s also matches the ASCII separators \x1c-\x1f; in bytes
+# patterns it does not, so text containing them is scanned as str
+_has_separator = re.compile(r'[\x1c-\x1f]').search
+
+# A match inside a match of a higher-priority entity type is dropped
+ENTITY_PRIORITY = {
+    EntityType.SSN: 6,
+    EntityType.CREDIT_CARD: 5,
+    EntityType.PHONE: 4,
+    EntityType.EMAIL: 3,
+    EntityType.FINANCIAL: 2,
+    EntityType.DATE: 1,
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _block(length: int, redaction_char: str) -> str:
+    """Return a run of redaction_char; match lengths repeat, so runs are cached."""
+    return redaction_char * length
+
+
+def _iter_candidates(compile_patterns, pattern_ids: Tuple[int, ...], subject):
+    """
+    Yield the matches of each pattern, scanned on its own.
+
+    Each pattern is compiled as a one-pattern alternation, so its matches carry
+    the group name _scan_spans maps back to an entity type. With its leading
+    \\b hoisted, each pattern lets the regex engine skip to the positions where
+    its first character occurs, which a single alternation over all of them
+    cannot do.
+
+    Args:
+        compile_patterns: _compile_patterns or _compile_bytes_patterns, matching subject
+        pattern_ids: Indices into PATTERNS to match
+        subject: Text (or ASCII-encoded bytes) to scan
+    """
+    for pattern_id in pattern_ids:
+        yield from compile_patterns((pattern_id,))[0].finditer(subject)
+
+
+def _scan_spans(matches, group_types: Dict[str, EntityType], entity_priority: Dict[EntityType, int]) -> List[Tuple[int, int, str]]:
+    """
+    Drop regex matches fully contained in a match of equal or higher priority.
+
+    Matches are visited by start, longest first. Overlapping matches that are
+    not contained in such a match are all kept, so redacting the union of the
+    returned spans masks everything any pattern matched.
+
+    Args:
+        matches: Iterable of match objects with named groups, overlaps allowed
+        group_types: Maps group name to entity type
+        entity_priority: Maps entity type to priority (higher wins)
+
+    Returns:
+        List of (start, end, group name) tuples, sorted by start
+    """
+    candidates = []
+    for match in matches:
+        start, end = match.span()
+        group = match.lastgroup
+        candidates.append((start, start - end, -entity_priority[group_types[group]], group))
+
+    candidates.sort()
+
+    accepted = []
+    active = []  # (end, priority) of accepted spans that may still contain later ones
+    for start, neg_length, neg_priority, group in candidates:
+        end, priority = start - neg_length, -neg_priority
+        if active:
+            active = [span for span in active if span[0] > start]
+            if any(active_end >= end and active_priority >= priority for active_end, active_priority in active):
+                continue
+
+        accepted.append((start, end, group))
+        active.append((end, priority))
+
+    return accepted
+
+
+def _cluster_matches(matches: List[RedactionMatch]) -> List[Tuple[int, int, List[RedactionMatch]]]:
+    """Group matches sorted by start into (start, end, matches) runs of overlapping matches."""
+    clusters = []
+    for match in matches:
+        if clusters and match.start < clusters[-1][1]:
+            cluster = clusters[-1]
+            clusters[-1] = (cluster[0], max(cluster[1], match.end), cluster[2] + [match])
+        else:
+            clusters.append((match.start, match.end, [match]))
+
+    return clusters
+
+
 class SimpleRedactionEngine:
     """
     Simple document redaction engine using only regex patterns.
@@ -38,83 +206,221 @@ class SimpleRedactionEngine:
     """
 
     def __init__(self):
-        self.patterns = self._compile_patterns()
-
-    def _compile_patterns(self) -> Dict[EntityType, List[re.Pattern]]:
-        """Compile regex patterns for different entity types."""
-        return {
-            EntityType.EMAIL: [
-                re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', re.IGNORECASE)
-            ],
-            EntityType.PHONE: [
-                re.compile(r'\b(?:\+?1[-.\s]?)?\(?([0-9]{3})\)?[-.\s]?([0-9]{3})[-.\s]?([0-9]{4})\b'),
-                re.compile(r'\b\d{3}[-.\s]?\d{3}[-.\s]?\d{4}\b'),
-                re.compile(r'\(\d{3}\)\s?\d{3}[-.\s]?\d{4}')
-            ],
-            EntityType.SSN: [
-                re.compile(r'\b\d{3}[-.\s]?\d{2}[-.\s]?\d{4}\b')
-            ],
-            EntityType.CREDIT_CARD: [
-                re.compile(r'\b4[0-9]{12}(?:[0-9]{3})?\b'),  # Visa
-                re.compile(r'\b5[1-5][0-9]{14}\b'),  # MasterCard
-                re.compile(r'\b3[47][0-9]{13}\b'),  # American Express
-                re.compile(r'\b6(?:011|5[0-9]{2})[0-9]{12}\b'),  # Discover
-                re.compile(r'\b(?:\d{4}[-\s]?){3}\d{4}\b')  # Generic format
-            ],
-            EntityType.DATE: [
-                re.compile(r'\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b'),
-                re.compile(r'\b\d{2,4}[/-]\d{1,2}[/-]\d{1,2}\b'),
-                re.compile(r'\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{1,2},?\s+\d{2,4}\b', re.IGNORECASE)
-            ],
-            EntityType.FINANCIAL: [
-                re.compile(r'\$\s?\d{1,3}(?:,\d{3})*(?:\.\d{2})?'),
-                re.compile(r'\b\d{1,3}(?:,\d{3})*(?:\.\d{2})?\s?(?:USD|dollars?)\b', re.IGNORECASE),
-                re.compile(r'\b(?:account|acct)\.?\s?#?\s?\d+\b', re.IGNORECASE),
-                re.compile(r'\b(?:routing|rt)\.?\s?#?\s?\d{9}\b', re.IGNORECASE)
-            ]
-        }
+        self.regex_union, self.group_types = self._compile_patterns(ALL_PATTERN_IDS)
+        self._compile_pattern_scanners()
+
+    @staticmethod
+    @functools.cache
+    def _compile_pattern_scanners() -> None:
+        """
+        Compile, once per process, the per-pattern regexes find_entities scans with.
+
+        Doing this up front keeps the first documents from paying for their
+        compilation.
+        """
+        for pattern_id in ALL_PATTERN_IDS:
+            SimpleRedactionEngine._compile_patterns((pattern_id,))
+            SimpleRedactionEngine._compile_bytes_patterns((pattern_id,))
+
+    @staticmethod
+    @functools.cache
+    def _compile_patterns(pattern_ids: Tuple[int, ...]) -> Tuple[re.Pattern, Dict[str, EntityType]]:
+        """
+        Compile regex patterns into a single alternation.
+
+        Each pattern becomes a named group (e.g. PHONE_7) that maps back to its
+        entity type. Results are cached, so every engine instance shares the
+        compiled patterns.
+
+        Args:
+            pattern_ids: Indices into PATTERNS to include
+        """
+        alternatives = []
+        group_types = {}
+
+        for pattern_id in pattern_ids:
+            entity_type, pattern = PATTERNS[pattern_id]
+            if not SUPPORTS_ATOMIC_GROUPS:
+                pattern = _without_atomic_groups(pattern)
+            pattern = _hoist_word_boundary(pattern)
+            group_name = f"{entity_type.name}_{pattern_id}"
+            alternatives.append(f"(?P<{group_name}>{pattern})")
+            group_types[group_name] = entity_type
+
+        return re.compile("|".join(alternatives)), group_types
+
+    @staticmethod
+    @functools.cache
+    def _compile_bytes_patterns(pattern_ids: Tuple[int, ...]) -> Tuple[re.Pattern, Dict[str, EntityType]]:
+        """Compile the alternation of _compile_patterns for scanning ASCII-encoded bytes."""
+        regex_union, group_types = SimpleRedactionEngine._compile_patterns(pattern_ids)
+        return re.compile(regex_union.pattern.encode("ascii")), group_types
+
+    @staticmethod
+    @functools.cache
+    def _screened_pattern_ids(has_digit: bool, has_at: bool, has_dollar: bool) -> Tuple[int, ...]:
+        """Return the ids of the patterns that can match given which sentinel characters occur."""
+        return tuple(
+            pattern_id for pattern_id in ALL_PATTERN_IDS
+            if (has_at if pattern_id in EMAIL_PATTERN_IDS else has_digit)
+            and (has_dollar or pattern_id not in DOLLAR_PATTERN_IDS)
+        )
 
     def find_entities(self, text: str) -> List[RedactionMatch]:
         """Find all entities in the text."""
-        matches = []
-
-        for entity_type, patterns in self.patterns.items():
-            for pattern in patterns:
-                for match in pattern.finditer(text):
-                    matches.append(RedactionMatch(
-                        text=match.group(),
-                        start=match.start(),
-                        end=match.end(),
-                        entity_type=entity_type,
-                        confidence=0.9
-                    ))
-
-        return matches
+        # Cheap C-level scans rule out patterns before any regex work, so clean
+        # text costs a few memchr-style passes
+        pattern_ids = self._screened_pattern_ids(
+            _has_digit(text) is not None, '@' in text, '$' in text
+        )
+        if not pattern_ids:
+            return []
+
+        subject = text
+        compile_patterns = self._compile_patterns
+        if text.isascii() and _has_separator(text) is None:
+            # Byte offsets equal character offsets for ASCII, and bytes patterns
+            # scan faster than str ones
+            subject = text.encode("ascii")
+            compile_patterns = self._compile_bytes_patterns
+
+        group_types = self.group_types
+        candidates = _iter_candidates(compile_patterns, pattern_ids, subject)
+        spans = _scan_spans(candidates, group_types, ENTITY_PRIORITY)
+        return [RedactionMatch(text[start:end], start, end, group_types[group], 0.9) for start, end, group in spans]
+
+    @staticmethod
+    def _mask_spans(text: str, spans: List[Tuple[int, int]], redaction_char: str) -> str:
+        """Replace (start, end) spans of text, sorted by start, with redaction_char."""
+        # Merge overlapping spans
+        merged: List[List[int]] = []
+        for start, end in spans:
+            if merged and start < merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], end)
+            else:
+                merged.append([start, end])
+
+        # Build the redacted text in a single pass
+        parts = []
+        append = parts.append
+        cursor = 0
+        for start, end in merged:
+            append(text[cursor:start])
+            append(_block(end - start, redaction_char))
+            cursor = end
+        append(text[cursor:])
+
+        return "".join(parts)
 
     def redact_text(self, text: str, redaction_char: str = "█") -> Tuple[str, List[RedactionMatch]]:
         """Redact sensitive information from text."""
+        # find_entities already returns matches sorted by start
         matches = self.find_entities(text)
+        spans = [(match.start, match.end) for match in matches]
+        return self._mask_spans(text, spans, redaction_char), matches
+
+    def redact_stream(self, reader, writer, chunk: int = 65536, overlap: int = 64,
+                      redaction_char: str = "█") -> List[RedactionMatch]:
+        """
+        Redact text read from reader in chunks, writing the result to writer.
+
+        Only about chunk + 2 * overlap characters are held in memory. Each window
+        keeps overlap characters of already-written text on the left (so word
+        boundaries see their context) and holds back the last overlap characters
+        until more text arrives; a run of overlapping matches crossing that point
+        is deferred whole to the next window. overlap should exceed the longest
+        expected run.
+
+        Args:
+            reader: Object with a read(size) method returning str ('' at EOF)
+            writer: Object with a write(str) method
+            chunk: Number of characters to read at a time
+            overlap: Characters of context kept on each side of a window
+            redaction_char: Character to use for redaction
+
+        Returns:
+            Matches found, with offsets into the whole stream
+        """
+        found = []
+        buffer = ""
+        base = 0  # stream offset of buffer[0]
+        done = 0  # characters of buffer already written
+
+        while True:
+            data = reader.read(chunk)
+            eof = not data
+            buffer += data
+
+            cut = len(buffer) if eof else len(buffer) - overlap
+            if cut <= done and not eof:
+                continue
 
-        # Sort matches by start position (reverse order for replacement)
-        matches.sort(key=lambda x: x.start, reverse=True)
-
-        # Apply redactions
-        redacted_text = text
-        for match in matches:
-            redaction = redaction_char * len(match.text)
-            redacted_text = redacted_text[:match.start] + redaction + redacted_text[match.end:]
-
-        return redacted_text, matches
+            spans = []
+            for start, end, matches in _cluster_matches(self.find_entities(buffer)):
+                if end <= done:
+                    continue
+                if start >= cut:
+                    break
+                if end > cut:
+                    if start > done:
+                        cut = start
+                        break
+                    # No room to defer it, so take the whole run now
+                    cut = end
+
+                found.extend(
+                    replace(match, start=base + match.start, end=base + match.end)
+                    for match in matches if match.start >= done
+                )
+                # Never re-mask text that has already been written
+                spans.append((max(start, done) - done, end - done))
+
+            writer.write(self._mask_spans(buffer[done:cut], spans, redaction_char))
+
+            if eof:
+                return found
+
+            keep = max(cut - overlap, 0)
+            buffer = buffer[keep:]
+            base += keep
+            done = cut - keep
+
+    def redact_many(self, texts: List[str], redaction_char: str = "█",
+                    workers: Optional[int] = None) -> List[Tuple[str, List[RedactionMatch]]]:
+        """
+        Redact many independent texts in parallel across processes.
+
+        Args:
+            texts: Texts to redact
+            redaction_char: Character to use for redaction
+            workers: Number of worker processes (default: one per CPU)
+
+        Returns:
+            (redacted text, matches) for each text, in input order
+        """
+        worker = functools.partial(_worker_redact, redaction_char=redaction_char)
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+            return list(executor.map(worker, texts, chunksize=16))
 
     def get_summary(self, matches: List[RedactionMatch]) -> Dict:
         """Generate a summary of redacted entities."""
-        summary = {"total": len(matches), "by_type": {}}
+        by_type = Counter(match.entity_type.value for match in matches)
+        return {"total": len(matches), "by_type": dict(by_type)}
+
+
+# Engine of a redact_many worker process, built once by _init_worker
+_worker_engine: Optional[SimpleRedactionEngine] = None
 
-        for match in matches:
-            entity_type = match.entity_type.value
-            summary["by_type"][entity_type] = summary["by_type"].get(entity_type, 0) + 1
 
-        return summary
+def _init_worker():
+    """Build the engine (and compile its patterns) once per worker process."""
+    global _worker_engine
+    _worker_engine = SimpleRedactionEngine()
+
+
+def _worker_redact(text: str, redaction_char: str) -> Tuple[str, List[RedactionMatch]]:
+    """Redact one text in a worker process."""
+    return _worker_engine.redact_text(text, redaction_char)
 
 
 def demo_interactive():
@@ -128,7 +434,14 @@ def demo_interactive():
 
     while True:
         try:
-            text = input("📝 Enter text: ").strip()
+            sys.stdout.write("📝 Enter text: ")
+            sys.stdout.flush()
+            line = sys.stdin.readline()
+            if not line:
+                # End of input
+                break
+
+            text = line.strip()
 
             if text.lower() in ['quit', 'exit', 'q']:
                 break
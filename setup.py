@@ -25,8 +25,8 @@ def run_command(command, description):
 def check_python_version():
     """Check if Python version is compatible."""
     print("🔍 Checking Python version...")
-    if sys.version_info < (3, 9):
-        print("❌ Python 3.9 or higher is required")
+    if sys.version_info < (3, 10):
+        print("❌ Python 3.10 or higher is required")
         return False
     print(f"✅ Python {sys.version_info.major}.{sys.version_info.minor} is compatible")
     return True